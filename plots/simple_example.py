@@ -4,23 +4,28 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def load_data(filepath):
-    """Load bird data from JSON file"""
+    """Load bird data from JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     with open(filepath, 'r') as f:
         data = json.load(f)
     return data
 
 def check_sphere_constraint(positions, radius):
-    """Check if all positions lie on the sphere surface"""
-    distances = []
-    for bird in positions:
-        pos = bird['position']
-        distance = np.sqrt(pos['x']**2 + pos['y']**2 + pos['z']**2)
-        distances.append(distance)
-    
-    distances = np.array(distances)
-    mean_dist = np.mean(distances)
-    std_dist = np.std(distances)
+    """Check if all positions lie on the sphere surface.
+
+    `positions` is an (N, 3) ndarray of bird positions.
+    """
+    distances = np.linalg.norm(positions, axis=1)
+    mean_dist = distances.mean()
+    std_dist = distances.std()
     
     print(f"Expected radius: {radius}")
     print(f"Mean distance from origin: {mean_dist:.6f}")
@@ -51,7 +56,7 @@ def visualize_birds_on_sphere(data):
     
     # Check sphere constraint
     print("Checking sphere constraint:")
-    distances = check_sphere_constraint(birds, radius)
+    distances = check_sphere_constraint(positions, radius)
     
     # Create sphere surface
     sphere_x, sphere_y, sphere_z = create_sphere_surface(radius)
@@ -68,7 +73,13 @@ def visualize_birds_on_sphere(data):
         name='Sphere Surface'
     ))
     
-    # Add bird positions
+    # Add bird positions; hover labels come from one int array rather
+    # than a formatted string per bird, and are dropped for huge flocks
+    if len(birds) > 1000:
+        hover_args = dict(hoverinfo='skip')
+    else:
+        hover_args = dict(customdata=np.arange(1, len(birds) + 1),
+                          hovertemplate='Bird %{customdata}<extra></extra>')
     fig.add_trace(go.Scatter3d(
         x=positions[:, 0],
         y=positions[:, 1],
@@ -77,25 +88,26 @@ def visualize_birds_on_sphere(data):
         marker=dict(
             size=8,
             color='red',
-            symbol='circle'
+            symbol='circle',
+            line=dict(width=0)
         ),
         name='Bird Positions',
-        text=[f'Bird {i+1}' for i in range(len(birds))]
+        **hover_args
     ))
     
-    # Add velocity vectors
-    for i, (pos, vel) in enumerate(zip(positions, velocities)):
-        # Scale velocity vectors for better visibility
-        scale = 0.2
-        fig.add_trace(go.Scatter3d(
-            x=[pos[0], pos[0] + vel[0] * scale],
-            y=[pos[1], pos[1] + vel[1] * scale],
-            z=[pos[2], pos[2] + vel[2] * scale],
-            mode='lines',
-            line=dict(color='green', width=3),
-            showlegend=False,
-            name=f'Velocity {i+1}'
-        ))
+    # Add velocity vectors as a single instanced Cone trace
+    # (one GPU draw call for the whole flock)
+    scale = 0.2
+    fig.add_trace(go.Cone(
+        x=positions[:, 0], y=positions[:, 1], z=positions[:, 2],
+        u=velocities[:, 0], v=velocities[:, 1], w=velocities[:, 2],
+        anchor='tail',
+        sizemode='scaled',
+        sizeref=scale,
+        colorscale=[[0, 'green'], [1, 'green']],
+        showscale=False,
+        name='Velocities'
+    ))
     
     # Update layout
     fig.update_layout(
@@ -120,8 +132,9 @@ def create_distance_histogram(data):
     birds = data['birds']
     params = data['params']
     radius = params['radius']
-    
-    distances = check_sphere_constraint(birds, radius)
+
+    positions = np.array([[bird['position']['x'], bird['position']['y'], bird['position']['z']] for bird in birds])
+    distances = check_sphere_constraint(positions, radius)
     
     fig = go.Figure()
     fig.add_trace(go.Histogram(
@@ -0,0 +1,439 @@
+import itertools
+import json
+import math
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Prefer the AOT-built extension (no JIT warmup), then the JIT kernels,
+# then the pure-NumPy fallbacks inside create_trajectory_analysis.
+try:
+    from vicsek_kernels import order_param as _order_parameter_kernel
+    from vicsek_kernels import vel_stats as _velocity_stats_kernel
+except ImportError:
+    try:
+        from kernels import order_param as _order_parameter_kernel
+        from kernels import vel_stats as _velocity_stats_kernel
+    except ImportError:
+        _order_parameter_kernel = None
+        _velocity_stats_kernel = None
+
+_BIRD_COLUMNS = ['position.x', 'position.y', 'position.z',
+                 'velocity.x', 'velocity.y', 'velocity.z']
+
+def _birds_to_array(birds, dtype=np.float64):
+    """Flatten nested bird records into an (N, 6) ndarray via json_normalize"""
+    if simdjson is not None and not isinstance(birds, list):
+        # json_normalize needs real dicts; as_list materializes at C level
+        birds = birds.as_list()
+    df = pd.json_normalize(birds)
+    return df[_BIRD_COLUMNS].to_numpy(dtype=dtype)
+
+def load_simulation_data(filepath):
+    """Load a SimulationResult JSON export.
+
+    Prefers pysimdjson, which parses lazily and never materializes
+    subtrees we do not touch; falls back to orjson and then the stdlib.
+    """
+    if simdjson is not None:
+        parser = simdjson.Parser()
+        return parser.parse(Path(filepath).read_bytes())
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        data = json.load(f)
+    return data
+
+def extract_trajectories(data):
+    """Extract per-bird trajectory arrays from the simulation snapshots"""
+    frames = data['snapshots']
+    num_frames = len(frames)
+    num_birds = data['params']['num_birds']
+
+    # One flat pass over the nested dicts, then a single C-level array
+    # construction instead of O(frames * birds) scalar assignments.
+    flat = itertools.chain.from_iterable(
+        (bird['position']['x'], bird['position']['y'], bird['position']['z'],
+         bird['velocity']['x'], bird['velocity']['y'], bird['velocity']['z'])
+        for frame in frames for bird in frame['birds']
+    )
+    arr = np.fromiter(flat, dtype=np.float64, count=num_frames * num_birds * 6)
+    # float32 halves memory and the JSON payload Plotly ships to the
+    # browser; analysis casts back to float64 where precision matters
+    arr = arr.reshape(num_frames, num_birds, 6).astype(np.float32)
+
+    trajectories = {
+        'x': arr[:, :, 0].T.copy(),
+        'y': arr[:, :, 1].T.copy(),
+        'z': arr[:, :, 2].T.copy(),
+        'vx': arr[:, :, 3].T.copy(),
+        'vy': arr[:, :, 4].T.copy(),
+        'vz': arr[:, :, 5].T.copy(),
+        'times': np.asarray([frame['timestamp'] for frame in frames], dtype=np.float64),
+        'steps': np.asarray([frame['step'] for frame in frames], dtype=np.int64),
+    }
+
+    return trajectories
+
+def extract_trajectories_from_file(filepath):
+    """Stream snapshots from a JSON export one at a time.
+
+    With ijson installed, peak memory stays at one snapshot of Python
+    objects instead of the whole document; the trajectory arrays are
+    preallocated from the simulation params. Falls back to a full parse
+    otherwise.
+    """
+    if ijson is None:
+        return extract_trajectories(load_simulation_data(filepath))
+
+    with open(filepath, 'rb') as f:
+        params = next(ijson.items(f, 'params'))
+    num_birds = params['num_birds']
+    frame_interval = params['frame_interval']
+    expected_frames = (params['total_iterations'] + frame_interval - 1) // frame_interval
+
+    trajectories = {
+        key: np.zeros((num_birds, expected_frames), dtype=np.float32)
+        for key in ('x', 'y', 'z', 'vx', 'vy', 'vz')
+    }
+    # Typed index-assignment instead of growing Python lists of boxed
+    # numbers; the band/trace plotting wants ndarrays anyway
+    trajectories['times'] = np.empty(expected_frames, dtype=np.float64)
+    trajectories['steps'] = np.empty(expected_frames, dtype=np.int64)
+
+    num_frames = 0
+    with open(filepath, 'rb') as f:
+        for frame_idx, frame in enumerate(ijson.items(f, 'snapshots.item')):
+            trajectories['times'][frame_idx] = float(frame['timestamp'])
+            trajectories['steps'][frame_idx] = frame['step']
+            arr = _birds_to_array(frame['birds'], dtype=np.float32)
+            for col, key in enumerate(('x', 'y', 'z', 'vx', 'vy', 'vz')):
+                trajectories[key][:, frame_idx] = arr[:, col]
+            num_frames += 1
+
+    if num_frames != expected_frames:
+        for key in ('x', 'y', 'z', 'vx', 'vy', 'vz'):
+            trajectories[key] = trajectories[key][:, :num_frames]
+        trajectories['times'] = trajectories['times'][:num_frames]
+        trajectories['steps'] = trajectories['steps'][:num_frames]
+
+    return trajectories
+
+def load_or_extract_trajectories(filepath):
+    """Extract trajectories, reusing a sidecar .npz cache when possible.
+
+    The cache name encodes the source file's mtime and size, so a
+    changed export invalidates it and a re-run on the same file skips
+    JSON parsing entirely.
+    """
+    source = Path(filepath)
+    stat = source.stat()
+    cache = source.with_suffix(f'.{int(stat.st_mtime)}-{stat.st_size}.npz')
+
+    if cache.exists():
+        with np.load(cache) as archive:
+            return dict(archive)
+
+    trajectories = extract_trajectories_from_file(filepath)
+    np.savez(cache, **trajectories)
+    return trajectories
+
+@lru_cache(maxsize=8)
+def _sphere_surface_arrays(radius, resolution):
+    """Cached (x, y, z) mesh for a sphere surface"""
+    u = np.linspace(0, 2 * np.pi, resolution)
+    v = np.linspace(0, np.pi, resolution)
+    x = radius * np.outer(np.cos(u), np.sin(v))
+    y = radius * np.outer(np.sin(u), np.sin(v))
+    z = radius * np.outer(np.ones(np.size(u)), np.cos(v))
+    return x, y, z
+
+def create_sphere_surface(radius, resolution=50):
+    """Create a sphere surface for visualization"""
+    return _sphere_surface_arrays(radius, resolution)
+
+@lru_cache(maxsize=8)
+def _sphere_wireframe_arrays(radius, resolution):
+    """Cached NaN-separated (x, y, z) arrays for a sphere wireframe"""
+    lines_x, lines_y, lines_z = [], [], []
+    nan_break = np.array([np.nan])
+    theta_line = np.linspace(0, np.pi, resolution)
+    phi_line = np.linspace(0, 2 * np.pi, resolution)
+    phi = np.linspace(0, 2 * np.pi, resolution)
+    theta = np.linspace(0, np.pi, resolution)
+
+    # Meridians (constant azimuth)
+    for p in phi[::4]:
+        lines_x.extend((radius * np.sin(theta_line) * np.cos(p), nan_break))
+        lines_y.extend((radius * np.sin(theta_line) * np.sin(p), nan_break))
+        lines_z.extend((radius * np.cos(theta_line), nan_break))
+
+    # Parallels (constant polar angle)
+    for t in theta[::4]:
+        lines_x.extend((radius * np.sin(t) * np.cos(phi_line), nan_break))
+        lines_y.extend((radius * np.sin(t) * np.sin(phi_line), nan_break))
+        lines_z.extend((radius * np.cos(t) * np.ones_like(phi_line), nan_break))
+
+    return np.concatenate(lines_x), np.concatenate(lines_y), np.concatenate(lines_z)
+
+def create_sphere_wireframe(radius, resolution=30):
+    """Create the sphere wireframe as a single NaN-separated trace"""
+    x, y, z = _sphere_wireframe_arrays(radius, resolution)
+    return [go.Scatter3d(
+        x=x, y=y, z=z,
+        mode='lines',
+        line=dict(color='lightgray', width=2),
+        showlegend=False,
+        hoverinfo='skip'
+    )]
+
+def add_frame_traces(fig, data, frame_index, sphere_traces, row=None, col=None):
+    """Add one snapshot's traces to a figure (optionally a subplot scene)"""
+    frame = data['snapshots'][frame_index]
+
+    # One C-level flattening pass instead of per-bird dict chasing
+    arr = _birds_to_array(frame['birds'])
+    x_pos, y_pos, z_pos, vx, vy, vz = arr.T
+
+    # Sphere wireframe (precomputed traces, shared between scenes)
+    for trace in sphere_traces:
+        fig.add_trace(trace, row=row, col=col)
+
+    # Bird positions. Hover labels ship one int array instead of N
+    # formatted strings, and are skipped outright for huge flocks.
+    if len(x_pos) > 1000:
+        hover_args = dict(hoverinfo='skip')
+    else:
+        hover_args = dict(customdata=np.arange(len(x_pos)),
+                          hovertemplate='Bird %{customdata}<extra></extra>')
+    fig.add_trace(go.Scatter3d(
+        x=x_pos, y=y_pos, z=z_pos,
+        mode='markers',
+        marker=dict(size=4, color='red', line=dict(width=0)),
+        name='Birds',
+        **hover_args
+    ), row=row, col=col)
+
+    # Velocity vectors as a single instanced Cone trace; scales to
+    # thousands of birds, so no small-flock guard is needed
+    fig.add_trace(go.Cone(
+        x=x_pos, y=y_pos, z=z_pos,
+        u=vx, v=vy, w=vz,
+        anchor='tail',
+        sizemode='scaled',
+        sizeref=0.2,
+        colorscale=[[0, 'green'], [1, 'green']],
+        showscale=False,
+        name='Velocities'
+    ), row=row, col=col)
+
+    return frame
+
+def plot_frame(data, frame_index=0):
+    """Plot a single snapshot of the flock on the sphere"""
+    radius = data['params']['radius']
+
+    fig = go.Figure()
+    frame = add_frame_traces(fig, data, frame_index, create_sphere_wireframe(radius))
+
+    fig.update_layout(
+        title=f"Flock at step {frame['step']} (t={frame['timestamp']:.2f})",
+        scene=dict(
+            xaxis_title='X',
+            yaxis_title='Y',
+            zaxis_title='Z',
+            aspectmode='cube'
+        ),
+        width=800,
+        height=600
+    )
+
+    return fig
+
+def create_trajectory_analysis(trajectories):
+    """Create order-parameter and velocity-statistics plots over time"""
+    # Reductions run in float64 to avoid cancellation on large flocks
+    vx = np.asarray(trajectories['vx'], dtype=np.float64)
+    vy = np.asarray(trajectories['vy'], dtype=np.float64)
+    vz = np.asarray(trajectories['vz'], dtype=np.float64)
+    num_birds, num_frames = vx.shape
+
+    # Order parameter: magnitude of the mean normalized velocity
+    if _order_parameter_kernel is not None:
+        order_parameter = _order_parameter_kernel(vx, vy, vz)
+    else:
+        speeds = np.sqrt(vx**2 + vy**2 + vz**2)
+        # clamp in place; avoids the boolean mask + fancy-indexed
+        # scatter of speeds[speeds == 0] = 1
+        np.maximum(speeds, np.finfo(speeds.dtype).tiny, out=speeds)
+        order_parameter = np.sqrt(
+            (vx / speeds).sum(axis=0)**2
+            + (vy / speeds).sum(axis=0)**2
+            + (vz / speeds).sum(axis=0)**2
+        ) / num_birds
+
+    # Velocity magnitude statistics per frame
+    if _velocity_stats_kernel is not None:
+        mean_vel, std_vel = _velocity_stats_kernel(vx, vy, vz)
+    else:
+        vel_magnitudes = np.sqrt(vx**2 + vy**2 + vz**2)
+        mean_vel = np.mean(vel_magnitudes, axis=0)
+        std_vel = np.std(vel_magnitudes, axis=0)
+
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Order Parameter', 'Velocity Magnitude')
+    )
+
+    fig.add_trace(go.Scatter(
+        x=trajectories['times'], y=order_parameter,
+        mode='lines', name='Order Parameter',
+        line=dict(color='blue')
+    ), row=1, col=1)
+
+    # Mean velocity with a ±1σ band
+    times = trajectories['times']
+    band_x = np.concatenate([times, times[::-1]])
+    band_y = np.concatenate([mean_vel + std_vel, (mean_vel - std_vel)[::-1]])
+    fig.add_trace(go.Scatter(
+        x=band_x, y=band_y,
+        fill='toself', fillcolor='rgba(255,0,0,0.15)',
+        line=dict(width=0), showlegend=False, hoverinfo='skip'
+    ), row=2, col=1)
+    fig.add_trace(go.Scatter(
+        x=trajectories['times'], y=mean_vel,
+        mode='lines', name='Mean Speed',
+        line=dict(color='red')
+    ), row=2, col=1)
+
+    fig.update_xaxes(title_text='Time', row=2, col=1)
+    fig.update_yaxes(title_text='φ', row=1, col=1)
+    fig.update_yaxes(title_text='|v|', row=2, col=1)
+    fig.update_layout(width=800, height=600, title='Trajectory Analysis')
+
+    return fig
+
+def create_animated_visualization(trajectories, radius):
+    """Create an animated 3D visualization of the flock"""
+    sphere_x, sphere_y, sphere_z = create_sphere_surface(radius)
+
+    sphere_surface = go.Surface(
+        x=sphere_x, y=sphere_y, z=sphere_z,
+        opacity=0.3, colorscale='Blues', showscale=False
+    )
+
+    # Animation frames are strided slices of the already-extracted
+    # (birds, frames, 3) array; no snapshot dicts are re-walked here.
+    positions_all = np.stack(
+        [trajectories['x'], trajectories['y'], trajectories['z']], axis=-1
+    )
+    steps = trajectories['steps']
+
+    # The sphere is static, so frames carry only the bird trace and
+    # point at trace index 1; the Surface is serialized exactly once.
+    frames = []
+    for frame_idx in range(0, positions_all.shape[1], 5):
+        pos = positions_all[:, frame_idx, :]
+        frames.append(go.Frame(
+            data=[go.Scatter3d(
+                x=pos[:, 0], y=pos[:, 1], z=pos[:, 2],
+                mode='markers',
+                marker=dict(size=4, color='red')
+            )],
+            traces=[1],
+            name=f"frame_{steps[frame_idx]}"
+        ))
+
+    first = positions_all[:, 0, :]
+    fig = go.Figure(
+        data=[
+            sphere_surface,
+            go.Scatter3d(
+                x=first[:, 0], y=first[:, 1], z=first[:, 2],
+                mode='markers',
+                marker=dict(size=4, color='red')
+            ),
+        ],
+        frames=frames
+    )
+
+    fig.update_layout(
+        title='Flock Animation',
+        scene=dict(aspectmode='cube'),
+        uirevision='constant',
+        width=800,
+        height=600,
+        updatemenus=[dict(
+            type='buttons',
+            buttons=[
+                dict(label='Play', method='animate',
+                     args=[None, dict(frame=dict(duration=50, redraw=True), fromcurrent=True)]),
+                dict(label='Pause', method='animate',
+                     args=[[None], dict(frame=dict(duration=0, redraw=False), mode='immediate')]),
+            ]
+        )]
+    )
+
+    return fig
+
+def main():
+    # Load data
+    data_file = 'data/simulation/t0-i0.json'
+    data = load_simulation_data(data_file)
+
+    params = data['params']
+    print(f"Loaded simulation with {params['num_birds']} birds, {len(data['snapshots'])} snapshots")
+    print(f"Simulation parameters: {params}")
+    print()
+
+    # First and last snapshots side by side, sharing one wireframe and
+    # one browser figure instead of two standalone plots
+    sphere_traces = create_sphere_wireframe(params['radius'])
+    fig_frames = make_subplots(
+        rows=1, cols=2,
+        specs=[[{'type': 'scene'}, {'type': 'scene'}]],
+        subplot_titles=('First snapshot', 'Last snapshot')
+    )
+    add_frame_traces(fig_frames, data, 0, sphere_traces, row=1, col=1)
+    add_frame_traces(fig_frames, data, -1, sphere_traces, row=1, col=2)
+    fig_frames.update_layout(
+        title='Flock: first vs last snapshot',
+        scene=dict(aspectmode='cube'),
+        scene2=dict(aspectmode='cube'),
+        width=1200,
+        height=600,
+        showlegend=False
+    )
+    fig_frames.show()
+
+    # Trajectory analysis (streamed on first run, .npz-cached afterwards)
+    trajectories = load_or_extract_trajectories(data_file)
+    fig_analysis = create_trajectory_analysis(trajectories)
+    fig_analysis.show()
+
+    # Animation
+    fig_anim = create_animated_visualization(trajectories, params['radius'])
+    fig_anim.show()
+
+if __name__ == "__main__":
+    main()